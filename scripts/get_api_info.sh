@@ -16,7 +16,7 @@ extract_api_info() {
 
     if [[ -n $api_version && -n $endpoint && -n $service ]]; then
         if [[ -z ${API_MAP[$service]} ]]; then
-            API_MAP["$service"]="{\"api_versions\": [\"$api_version\"], \"endpoint\": \"$endpoint\", \"service\": \"$service\"}"
+            API_MAP["$service"]="{\"api_versions\": [\"$api_version\"], \"endpoint\": \"$endpoint\", \"regional_endpoint\": \"${endpoint/./.{region\}.}\", \"service\": \"$service\"}"
         else
             API_MAP["$service"]=$(echo "${API_MAP[$service]}" | sed "s/\"apiVersion\": \[/\"apiVersion\": \[\"$api_version\",/")
         fi
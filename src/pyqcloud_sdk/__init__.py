@@ -4,9 +4,11 @@ __version__ = "0.0.2"
 
 from .base import QcloudBase
 from .config import Config
+from .endpoint import EndpointSelector
 from .exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
     ClientError,
     ConfigError,
     QcloudWrapperError,
@@ -17,11 +19,14 @@ from .exceptions import (
 )
 from .logging import logger, setup_logging
 from .services import Services
+from .signing import Payload
 
 __all__ = [
     "QcloudBase",
     "Config",
+    "EndpointSelector",
     "Services",
+    "Payload",
     "QcloudWrapperError",
     "ConfigError",
     "AuthenticationError",
@@ -31,6 +36,7 @@ __all__ = [
     "APIError",
     "ClientError",
     "ServerError",
+    "CircuitOpenError",
     "logger",
     "setup_logging",
 ]
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import os
-from time import sleep
-from typing import Any, Optional
+from time import monotonic, sleep
+from typing import Any, Optional, Union
 
 from tencentcloud.common.common_client import CommonClient
 from tencentcloud.common.credential import Credential
@@ -10,14 +10,31 @@ from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentClo
 from tencentcloud.common.profile.client_profile import ClientProfile
 from tencentcloud.common.profile.http_profile import HttpProfile
 
+from .breaker import CircuitBreaker, get_circuit_breaker
 from .config import Config
+from .endpoint import (
+    ENDPOINT_MODE_LATENCY,
+    ENDPOINT_MODE_REGIONAL,
+    EndpointSelector,
+    check_endpoint_mode,
+    regional_endpoint,
+)
 from .exceptions import (
     AuthenticationError,
+    CircuitOpenError,
     ClientError,
+    ConfigError,
     QcloudWrapperError,
     ServerError,
 )
+from .hedge import READ_ACTION_PREFIXES, HedgePolicy
 from .logging import logger
+from .signing import Payload, SigningClient
+
+# SDK error codes raised when an endpoint could not be reached or did not answer properly.
+_NETWORK_ERROR_CODES = ("ClientNetworkError", "ServerNetworkError")
+# Error code prefixes counted as failures by the circuit breaker, client-side errors are not.
+_BREAKER_ERROR_CODES = _NETWORK_ERROR_CODES + ("InternalError",)
 
 
 class QcloudBase:
@@ -34,7 +51,11 @@ class QcloudBase:
         """
         self.config = Config()
         self.config._deserialize(service_config)
+        self.config.EndPointMode = check_endpoint_mode(self.config.EndPointMode)
         self.client = client
+        self._endpoint_selector = None
+        self._breaker_options = None
+        self._hedge_policy = None
 
     def set_region(self, region: str):
         """
@@ -44,8 +65,67 @@ class QcloudBase:
             region (str): The region to use.
         """
         self.config.Region = region
+        self._endpoint_selector = None
         logger.info(f"Region set to: {region}")
 
+    def set_endpoint_mode(self, mode: str):
+        """
+        Sets how the endpoint is chosen for each call.
+
+        Args:
+            mode (str): "global" uses the catalog endpoint, "regional" uses the endpoint of the
+                        configured region, "latency" picks the fastest of both and fails over
+                        to the global endpoint on network errors.
+
+        Raises:
+            ConfigError: If the mode is invalid.
+        """
+        self.config.EndPointMode = check_endpoint_mode(mode)
+        self._endpoint_selector = None
+        logger.info(f"Endpoint mode set to: {mode}")
+
+    def enable_circuit_breaker(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Enables the circuit breaker shared by all clients of the same module and region.
+
+        After `failure_threshold` consecutive network or internal errors, calls fail fast with
+        CircuitOpenError until `recovery_timeout` seconds have passed and a probe call succeeds.
+        As the breaker is shared, the settings apply to every client of the same module and region.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that open the circuit. Defaults to 5.
+            recovery_timeout (float, optional): Seconds before a half-open probe is allowed. Defaults to 30.0.
+        """
+        self._breaker_options = {"failure_threshold": failure_threshold, "recovery_timeout": recovery_timeout}
+        breaker = self._get_circuit_breaker()
+        breaker.failure_threshold, breaker.recovery_timeout = failure_threshold, recovery_timeout
+        logger.info(f"Circuit breaker enabled for module: {self.config.Module}, region: {self.config.Region}")
+
+    def enable_hedging(
+        self,
+        actions: tuple = READ_ACTION_PREFIXES,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        budget: float = 0.1,
+    ):
+        """
+        Enables hedged requests for idempotent read actions.
+
+        When a call takes longer than the `quantile` of recent latencies, a second attempt is sent
+        and the first successful response is returned.
+
+        Args:
+            actions (tuple, optional): Prefixes of the actions to hedge, only list read-only actions.
+                                       Defaults to READ_ACTION_PREFIXES.
+            quantile (float, optional): Latency quantile used as the hedging delay. Defaults to 0.95.
+            min_samples (int, optional): Samples required before hedging starts. Defaults to 20.
+            budget (float, optional): Maximum share of calls that may send a hedged attempt. Defaults to 0.1.
+        """
+        if self._hedge_policy is not None:
+            self._hedge_policy.shutdown()
+        self._hedge_policy = HedgePolicy(actions, quantile, min_samples, budget=budget)
+        logger.info(f"Hedging enabled for actions: {actions}")
+
     def set_secret_key(self, secret_key: str):
         """
         Sets the SecretKey for authentication.
@@ -93,10 +173,35 @@ class QcloudBase:
         logger.info("Secrets set from environment variables.")
         return True
 
-    def _get_client(self) -> CommonClient:
+    def _resolve_endpoint(self) -> str:
+        """
+        Resolves the endpoint to use for the next call according to the endpoint mode.
+
+        Returns:
+            str: The endpoint to use.
+
+        Raises:
+            ConfigError: If the regional endpoint cannot be built.
+        """
+        mode = self.config.EndPointMode
+        if not self.config.EndPointTemplate or mode not in (ENDPOINT_MODE_REGIONAL, ENDPOINT_MODE_LATENCY):
+            return self.config.EndPoint
+
+        endpoint = regional_endpoint(self.config.EndPointTemplate, self.config.Region)
+        if mode == ENDPOINT_MODE_REGIONAL:
+            return endpoint
+
+        if self._endpoint_selector is None:
+            self._endpoint_selector = EndpointSelector([endpoint, self.config.EndPoint])
+        return self._endpoint_selector.select()
+
+    def _get_client(self, endpoint: Optional[str] = None) -> CommonClient:
         """
         Creates or returns an instance of CommonClient.
 
+        Args:
+            endpoint (Optional[str], optional): The endpoint to connect to. Defaults to the catalog endpoint.
+
         Returns:
             CommonClient: An instance of CommonClient for making API calls.
 
@@ -113,15 +218,15 @@ class QcloudBase:
 
         cred = Credential(self.config.SecretId, self.config.SecretKey)
         http_profile = HttpProfile()
-        http_profile.endpoint = self.config.EndPoint
+        http_profile.endpoint = endpoint or self.config.EndPoint
         client_profile = ClientProfile()
         client_profile.httpProfile = http_profile
 
         logger.info(
             f"Creating a new client for module: {self.config.Module}, "
-            f"version: {self.config.Version}, region: {self.config.Region}"
+            f"version: {self.config.Version}, region: {self.config.Region}, endpoint: {http_profile.endpoint}"
         )
-        return CommonClient(
+        return SigningClient(
             self.config.Module,
             self.config.Version,
             cred,
@@ -129,13 +234,15 @@ class QcloudBase:
             profile=client_profile,
         )
 
-    def call(self, action: str, action_params: dict = {}, headers: dict = {}) -> Any:
+    def call(self, action: str, action_params: Union[dict, Payload] = {}, headers: dict = {}) -> Any:
         """
         Makes a request to a Tencent Cloud API.
 
         Args:
             action (str): The API action to perform.
-            action_params (dict, optional): Parameters for the API call. Defaults to {}.
+            action_params (Union[dict, Payload], optional): Parameters for the API call, pass a Payload
+                                                            to reuse the serialized parameters across
+                                                            repeated calls. Defaults to {}.
             headers (dict, optional): Additional headers for the request. Defaults to {}.
 
         Returns:
@@ -145,11 +252,12 @@ class QcloudBase:
             AuthenticationError: If authentication fails.
             ClientError: For other client-side errors.
             ServerError: For errors originating from the Tencent Cloud server.
+            CircuitOpenError: If the circuit breaker is open.
+            ConfigError: If the endpoint cannot be resolved.
         """
         try:
-            client = self._get_client()
             logger.info(f"Calling action: {action} with params: {action_params}, headers: {headers}")
-            resp = client.call_json(action, action_params, headers=headers)
+            resp = self._send(action, action_params, headers)
             logger.debug(f"Response: {resp}")
 
             if isinstance(resp, dict) and resp.get("Response", {}).get("Error"):
@@ -163,9 +271,15 @@ class QcloudBase:
         except AuthenticationError as err:
             logger.error(f"Authentication Error: {err}")
             raise err
+        except ConfigError as err:
+            logger.error(f"Config Error: {err}")
+            raise err
         except ClientError as err:
             logger.error(f"Client Error: {err}")
             raise err
+        except CircuitOpenError as err:
+            logger.error(f"Circuit Open Error: {err}")
+            raise err
         except TencentCloudSDKException as err:
             logger.error(f"Tencent Cloud SDK Exception: {err}")
             raise ServerError(str(err)) from err
@@ -173,10 +287,127 @@ class QcloudBase:
             logger.exception(f"An unexpected error occurred: {err}")
             raise QcloudWrapperError(f"An unexpected error occurred: {err}") from err
 
+    def _get_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        Returns the circuit breaker of the current module and region.
+
+        Returns:
+            Optional[CircuitBreaker]: The shared circuit breaker, or None if it is not enabled.
+        """
+        if self._breaker_options is None:
+            return None
+        return get_circuit_breaker(self.config.Module, self.config.Region, **self._breaker_options)
+
+    def _send(self, action: str, action_params: Union[dict, Payload], headers: dict) -> Any:
+        """
+        Sends a request through the circuit breaker, hedging it if the action is configured for it.
+
+        Args:
+            action (str): The API action to perform.
+            action_params (Union[dict, Payload]): Parameters for the API call.
+            headers (dict): Additional headers for the request.
+
+        Returns:
+            Any: The API response data.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        breaker = self._get_circuit_breaker()
+        if breaker is not None:
+            generation = breaker.before_call()
+
+        # Other errors, such as AuthenticationError, say nothing about the backend and are not reported.
+        try:
+            if self._hedge_policy is not None and self._hedge_policy.is_hedged(action):
+                # Each attempt gets its own headers, the SDK adds a trace id to them.
+                resp = self._hedge_policy.run(lambda: self._call_endpoint(action, action_params, dict(headers)))
+            else:
+                resp = self._call_endpoint(action, action_params, headers)
+        except TencentCloudSDKException as err:
+            if breaker is not None:
+                breaker.after_call(generation, not (err.get_code() or "").startswith(_BREAKER_ERROR_CODES))
+            raise
+
+        if breaker is not None:
+            breaker.after_call(generation, True)
+        return resp
+
+    def _call_endpoint(self, action: str, action_params: Union[dict, Payload], headers: dict) -> Any:
+        """
+        Sends a request to the resolved endpoint.
+
+        In latency mode, the request latency is recorded and the call fails over to the
+        global endpoint if the selected endpoint cannot be reached.
+
+        Args:
+            action (str): The API action to perform.
+            action_params (Union[dict, Payload]): Parameters for the API call.
+            headers (dict): Additional headers for the request.
+
+        Returns:
+            Any: The API response data.
+        """
+        if self.client:
+            if isinstance(action_params, Payload) and not isinstance(self.client, SigningClient):
+                action_params = action_params.params
+            return self.client.call_json(action, action_params, headers=headers)
+
+        endpoint = self._resolve_endpoint()
+        client = self._get_client(endpoint)
+        selector = self._endpoint_selector
+        if selector is None:
+            return client.call_json(action, action_params, headers=headers)
+
+        try:
+            return self._call_measured(selector, endpoint, client, action, action_params, headers)
+        except TencentCloudSDKException as err:
+            if err.get_code() not in _NETWORK_ERROR_CODES or endpoint == self.config.EndPoint:
+                raise
+            logger.warning(f"Endpoint {endpoint} failed ({err.get_code()}), failing over to {self.config.EndPoint}")
+            client = self._get_client(self.config.EndPoint)
+            return self._call_measured(selector, self.config.EndPoint, client, action, action_params, headers)
+
+    @staticmethod
+    def _call_measured(
+        selector: EndpointSelector,
+        endpoint: str,
+        client: CommonClient,
+        action: str,
+        action_params: Union[dict, Payload],
+        headers: dict,
+    ) -> Any:
+        """
+        Sends a request and reports its latency, or a network failure, to the endpoint selector.
+
+        Args:
+            selector (EndpointSelector): The selector to report to.
+            endpoint (str): The endpoint the client connects to.
+            client (CommonClient): The client to send the request with.
+            action (str): The API action to perform.
+            action_params (Union[dict, Payload]): Parameters for the API call.
+            headers (dict): Additional headers for the request.
+
+        Returns:
+            Any: The API response data.
+        """
+        start = monotonic()
+        try:
+            resp = client.call_json(action, action_params, headers=headers)
+        except TencentCloudSDKException as err:
+            if err.get_code() in _NETWORK_ERROR_CODES:
+                selector.record_failure(endpoint)
+            else:
+                selector.record_success(endpoint, monotonic() - start)
+            raise
+
+        selector.record_success(endpoint, monotonic() - start)
+        return resp
+
     def call_with_retry(
         self,
         action: str,
-        action_params: dict,
+        action_params: Union[dict, Payload],
         max_retries: int = 5,
         retries: int = 0,
         retry_time: int = 5,
@@ -186,7 +417,8 @@ class QcloudBase:
 
         Args:
             action (str): The API action to perform.
-            action_params (dict): Parameters for the API call.
+            action_params (Union[dict, Payload]): Parameters for the API call, serialized once before
+                                                  the first retry.
             max_retries (int, optional): Maximum number of retries. Defaults to 5.
             retries (int, optional): Current retry count. Defaults to 0.
             retry_time (int, optional): Time to sleep between retries (in seconds). Defaults to 5.
@@ -205,12 +437,17 @@ class QcloudBase:
                     retries += 1
                     logger.info(f"Task is being processed, retrying {retries}/{max_retries}")
                     sleep(retry_time)
+                    # Serialize the params once for the remaining retries, the first attempt usually succeeds.
+                    if not isinstance(action_params, Payload):
+                        action_params = Payload(action_params)
                     return self.call_with_retry(action, action_params, max_retries, retries, retry_time)
                 else:
                     logger.error("Maximum number of retries reached.")
                     raise
             else:
                 raise
+        except (CircuitOpenError, ConfigError):
+            raise
         except Exception as err:
             logger.exception(f"An unexpected error occurred: {err}")
             raise QcloudWrapperError(f"An unexpected error occurred: {err}") from err
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from time import monotonic
+from typing import Dict, Tuple
+
+from .exceptions import CircuitOpenError
+from .logging import logger
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails fast after repeated failures and probes the backend with half-open requests."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initializes a CircuitBreaker object.
+
+        Args:
+            name (str): A name used in logs and errors, e.g. "cvm/ap-shanghai".
+            failure_threshold (int, optional): Consecutive failures that open the circuit. Defaults to 5.
+            recovery_timeout (float, optional): Seconds to wait before a half-open probe is allowed.
+                                                Defaults to 30.0.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = STATE_CLOSED
+        # Incremented on every state change, so results of calls admitted in an earlier state are ignored.
+        self._generation = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """str: The current state, one of "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._state == STATE_OPEN and monotonic() - self._opened_at >= self.recovery_timeout:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def before_call(self) -> int:
+        """
+        Checks whether a call may go through.
+
+        Returns:
+            int: The generation the call was admitted in, to be passed to `after_call`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a half-open probe is already in flight.
+        """
+        now = monotonic()
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return self._generation
+            if self._state == STATE_OPEN and now - self._opened_at >= self.recovery_timeout:
+                self._set_state(STATE_HALF_OPEN)
+                self._probe_started_at = None
+            # A probe that never reported back must not keep the circuit blocked forever.
+            if self._state == STATE_HALF_OPEN and (
+                self._probe_started_at is None or now - self._probe_started_at >= self.recovery_timeout
+            ):
+                self._probe_started_at = now
+                logger.info(f"Circuit {self.name} is half-open, sending a probe request")
+                return self._generation
+        raise CircuitOpenError(f"Circuit {self.name} is open, failing fast")
+
+    def after_call(self, generation: int, success: bool):
+        """
+        Records the outcome of a call allowed by `before_call`.
+
+        Args:
+            generation (int): The generation returned by `before_call`.
+            success (bool): Whether the backend handled the call properly.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            if success:
+                if self._state != STATE_CLOSED:
+                    logger.info(f"Circuit {self.name} closed")
+                    self._set_state(STATE_CLOSED)
+                self._failures = 0
+                return
+
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                logger.warning(f"Circuit {self.name} opened after {self._failures} consecutive failures")
+                self._set_state(STATE_OPEN)
+                self._opened_at = monotonic()
+
+    def _set_state(self, state: str):
+        self._state = state
+        self._generation += 1
+        self._failures = 0
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    module: str, region: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+) -> CircuitBreaker:
+    """
+    Returns the circuit breaker shared by all clients of a (module, region) pair.
+
+    Args:
+        module (str): The service module, e.g. "cvm".
+        region (str): The region, e.g. "ap-shanghai".
+        failure_threshold (int, optional): Used when the breaker is created. Defaults to 5.
+        recovery_timeout (float, optional): Used when the breaker is created. Defaults to 30.0.
+
+    Returns:
+        CircuitBreaker: The shared circuit breaker.
+    """
+    key = (module, region)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(f"{module}/{region}", failure_threshold, recovery_timeout)
+            _breakers[key] = breaker
+        return breaker
@@ -11,6 +11,8 @@ class Config(object):
         self.Module = None
         self.Version = None
         self.EndPoint = None
+        self.EndPointTemplate = None
+        self.EndPointMode = None
         self.Region = None
         self.SecretId = None
         self.SecretKey = None
@@ -25,6 +27,8 @@ class Config(object):
         self.Module = config.get("Module")
         self.Version = config.get("Version")
         self.EndPoint = config.get("EndPoint")
+        self.EndPointTemplate = config.get("EndPointTemplate")
+        self.EndPointMode = config.get("EndPointMode")
         self.Region = config.get("Region")
         self.SecretId = config.get("SecretId")
         self.SecretKey = config.get("SecretKey")
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from time import monotonic
+from typing import Dict, List, Optional
+
+from .exceptions import ConfigError
+from .logging import logger
+
+ENDPOINT_MODE_GLOBAL = "global"
+ENDPOINT_MODE_REGIONAL = "regional"
+ENDPOINT_MODE_LATENCY = "latency"
+ENDPOINT_MODES = (ENDPOINT_MODE_GLOBAL, ENDPOINT_MODE_REGIONAL, ENDPOINT_MODE_LATENCY)
+
+
+def regional_template(endpoint: str) -> str:
+    """
+    Derives a regional endpoint template from a global endpoint.
+
+    Args:
+        endpoint (str): The global endpoint, e.g. "cvm.tencentcloudapi.com".
+
+    Returns:
+        str: The regional template, e.g. "cvm.{region}.tencentcloudapi.com".
+    """
+    service, _, domain = endpoint.partition(".")
+    return f"{service}.{{region}}.{domain}"
+
+
+def regional_endpoint(template: str, region: str) -> str:
+    """
+    Renders a regional endpoint template for the given region.
+
+    Args:
+        template (str): The regional template, e.g. "cvm.{region}.tencentcloudapi.com".
+        region (str): The region to use, e.g. "ap-shanghai".
+
+    Returns:
+        str: The regional endpoint, e.g. "cvm.ap-shanghai.tencentcloudapi.com".
+
+    Raises:
+        ConfigError: If the template or region is invalid.
+    """
+    if not region:
+        raise ConfigError("Region is required to build a regional endpoint")
+    try:
+        return template.format(region=region)
+    except (KeyError, IndexError, ValueError) as err:
+        raise ConfigError(f"Invalid regional endpoint template '{template}': {err}") from err
+
+
+def check_endpoint_mode(mode: Optional[str]) -> str:
+    """
+    Validates an endpoint mode.
+
+    Args:
+        mode (Optional[str]): The endpoint mode, None means "global".
+
+    Returns:
+        str: The validated endpoint mode.
+
+    Raises:
+        ConfigError: If the mode is not one of ENDPOINT_MODES.
+    """
+    if mode is None:
+        return ENDPOINT_MODE_GLOBAL
+    if mode not in ENDPOINT_MODES:
+        raise ConfigError(f"Invalid endpoint mode '{mode}', available modes: {list(ENDPOINT_MODES)}")
+    return mode
+
+
+class EndpointSelector:
+    """Selects the fastest endpoint from a moving average of observed latencies."""
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        alpha: float = 0.3,
+        cooldown: float = 1.0,
+        max_cooldown: float = 60.0,
+        probe_interval: float = 60.0,
+    ):
+        """
+        Initializes an EndpointSelector object.
+
+        Args:
+            endpoints (List[str]): Candidate endpoints, in order of preference.
+            alpha (float, optional): Weight of the newest sample in the moving average. Defaults to 0.3.
+            cooldown (float, optional): Seconds a failed endpoint is skipped, doubled on each consecutive
+                                        failure. Defaults to 1.0.
+            max_cooldown (float, optional): Upper bound of the cooldown in seconds. Defaults to 60.0.
+            probe_interval (float, optional): Seconds after which an unused endpoint is probed again.
+                                              Defaults to 60.0.
+        """
+        if not endpoints:
+            raise ConfigError("EndpointSelector requires at least one endpoint")
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_interval = probe_interval
+        self._scores: Dict[str, float] = {}
+        self._last_used: Dict[str, float] = {}
+        # Failures are tracked apart from the latency average, so one error does not skew the score.
+        self._failures: Dict[str, int] = {}
+        self._cooldown_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def score(self, endpoint: str) -> Optional[float]:
+        """
+        Returns the moving-average latency of an endpoint.
+
+        Args:
+            endpoint (str): The endpoint to look up.
+
+        Returns:
+            Optional[float]: The score in seconds, or None if the endpoint has not been measured.
+        """
+        return self._scores.get(endpoint)
+
+    def select(self) -> str:
+        """
+        Picks the endpoint to use for the next request.
+
+        Endpoints cooling down after a failure are skipped, unless all of them are. Among the others,
+        unmeasured endpoints and endpoints not used for `probe_interval` seconds are tried first,
+        otherwise the endpoint with the lowest score wins.
+
+        Returns:
+            str: The selected endpoint.
+        """
+        now = monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if self._cooldown_until.get(e, 0) <= now]
+            if not candidates:
+                endpoint = min(self.endpoints, key=self._cooldown_until.__getitem__)
+                self._last_used[endpoint] = now
+                return endpoint
+            for endpoint in candidates:
+                if endpoint not in self._scores or now - self._last_used[endpoint] >= self.probe_interval:
+                    self._last_used[endpoint] = now
+                    return endpoint
+            endpoint = min(candidates, key=self._scores.__getitem__)
+            self._last_used[endpoint] = now
+            return endpoint
+
+    def record_success(self, endpoint: str, elapsed: float):
+        """
+        Records the latency of a completed request.
+
+        The first success after a failure restarts the score from the measured latency.
+
+        Args:
+            endpoint (str): The endpoint that served the request.
+            elapsed (float): The request latency in seconds.
+        """
+        with self._lock:
+            previous = self._scores.get(endpoint)
+            if previous is None or self._failures.pop(endpoint, 0):
+                self._scores[endpoint] = elapsed
+            else:
+                self._scores[endpoint] = self.alpha * elapsed + (1 - self.alpha) * previous
+            self._cooldown_until.pop(endpoint, None)
+            self._last_used.setdefault(endpoint, monotonic())
+
+    def record_failure(self, endpoint: str):
+        """
+        Records a failed request, skipping the endpoint for a cooldown that grows with consecutive failures.
+
+        Args:
+            endpoint (str): The endpoint that failed.
+        """
+        with self._lock:
+            failures = self._failures.get(endpoint, 0) + 1
+            self._failures[endpoint] = failures
+            cooldown = min(self.cooldown * 2 ** (failures - 1), self.max_cooldown)
+            self._cooldown_until[endpoint] = monotonic() + cooldown
+        logger.warning(f"Endpoint {endpoint} failed {failures} time(s) in a row, skipping it for {cooldown:.1f}s")
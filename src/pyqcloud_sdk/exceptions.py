@@ -62,6 +62,12 @@ class ServerError(APIError):
         return self._request_id
 
 
+class CircuitOpenError(APIError):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+    pass
+
+
 class LoggingError(QcloudWrapperError):
     """Raised for errors related to logging."""
 
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic
+from typing import Any, Callable, Optional, Tuple
+
+from .logging import logger
+
+# Action prefixes of read-only Tencent Cloud APIs, which are safe to send twice.
+READ_ACTION_PREFIXES = ("Describe", "Get", "List", "Query", "Inquiry")
+# Maximum number of hedged attempts the budget can save up for a burst of slow calls.
+_MAX_HEDGE_BURST = 10.0
+
+
+class HedgePolicy:
+    """Sends a second attempt of slow idempotent calls and returns the first response."""
+
+    def __init__(
+        self,
+        actions: Tuple[str, ...] = READ_ACTION_PREFIXES,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 8,
+        budget: float = 0.1,
+    ):
+        """
+        Initializes a HedgePolicy object.
+
+        Args:
+            actions (Tuple[str, ...], optional): Prefixes of the actions to hedge.
+                                                 Defaults to READ_ACTION_PREFIXES.
+            quantile (float, optional): Latency quantile used as the hedging delay. Defaults to 0.95.
+            min_samples (int, optional): Samples required before hedging starts. Defaults to 20.
+            window (int, optional): Number of recent latencies kept. Defaults to 200.
+            max_workers (int, optional): Threads available for hedged attempts, first attempts
+                                         do not use them. Defaults to 8.
+            budget (float, optional): Maximum share of calls that may send a hedged attempt. Defaults to 0.1.
+        """
+        self.actions = tuple(actions)
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.budget = budget
+        self._latencies = deque(maxlen=window)
+        # Each call earns `budget` tokens and each hedged attempt spends one.
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyqcloud-hedge")
+
+    def is_hedged(self, action: str) -> bool:
+        """
+        Checks whether an action should be hedged.
+
+        Args:
+            action (str): The API action.
+
+        Returns:
+            bool: True if the action matches one of the configured prefixes.
+        """
+        return action.startswith(self.actions)
+
+    def delay(self) -> Optional[float]:
+        """
+        Returns the delay after which a hedged attempt is sent.
+
+        Returns:
+            Optional[float]: The configured latency quantile in seconds, or None if there are
+                             not enough samples yet.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[min(int(len(latencies) * self.quantile), len(latencies) - 1)]
+
+    def record(self, elapsed: float):
+        """
+        Records the latency of a successful attempt.
+
+        Args:
+            elapsed (float): The attempt latency in seconds.
+        """
+        with self._lock:
+            self._latencies.append(elapsed)
+
+    def run(self, func: Callable[[], Any]) -> Any:
+        """
+        Runs `func`, sending a hedged attempt if it exceeds the hedging delay.
+
+        The first attempt runs on its own thread while the caller waits, and the hedging delay starts
+        when that attempt does. The hedged attempt runs on the pool, only if the hedging budget allows it.
+        The first successful response is returned, and a hedged attempt still queued is cancelled.
+
+        Args:
+            func (Callable[[], Any]): The idempotent call to run.
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            Exception: The last error, if every attempt failed.
+        """
+        delay = self.delay()
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget, _MAX_HEDGE_BURST)
+        if delay is None:
+            return self._run_and_record(func)
+
+        primary, started = Future(), threading.Event()
+        threading.Thread(
+            target=self._run_into, args=(primary, func, started), name="pyqcloud-primary", daemon=True
+        ).start()
+        started.wait()
+
+        pending = {primary}
+        done, _ = wait(pending, timeout=delay)
+        if not done and self._take_token():
+            logger.info(f"No response after {delay:.3f}s, sending a hedged request")
+            try:
+                pending.add(self._executor.submit(self._run_and_record, func))
+            except RuntimeError:
+                logger.info("Hedging pool is shut down, no hedged request sent")
+
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def shutdown(self):
+        """Shuts down the hedging pool, hedged attempts already running are left to finish."""
+        self._executor.shutdown(wait=False)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                logger.info("Hedging budget exhausted, no hedged request sent")
+                return False
+            self._tokens -= 1
+            return True
+
+    def _run_and_record(self, func: Callable[[], Any]) -> Any:
+        start = monotonic()
+        result = func()
+        self.record(monotonic() - start)
+        return result
+
+    def _run_into(self, future: Future, func: Callable[[], Any], started: threading.Event):
+        future.set_running_or_notify_cancel()
+        started.set()
+        try:
+            future.set_result(self._run_and_record(func))
+        except BaseException as err:
+            future.set_exception(err)
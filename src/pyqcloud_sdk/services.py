@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 
 from .logging import logger
 from .base import QcloudBase
+from .endpoint import regional_template
 from .exceptions import (
     ServiceDefinitionError,
     ServiceDiscoveryError,
@@ -24,6 +25,7 @@ class Services(QcloudBase):
         secret_id: Optional[str] = None,
         secret_key: Optional[str] = None,
         version: Optional[str] = None,
+        endpoint_mode: Optional[str] = None,
     ):
         """
         Initializes a Services object.
@@ -34,6 +36,8 @@ class Services(QcloudBase):
             secret_id (Optional[str], optional): The Tencent Cloud SecretId. Defaults to None.
             secret_key (Optional[str], optional): The Tencent Cloud SecretKey. Defaults to None.
             version (Optional[str], optional): The API version of the service. Defaults to None.
+            endpoint_mode (Optional[str], optional): How the endpoint is chosen, one of "global",
+                                                     "regional" or "latency". Defaults to "global".
 
         Raises:
             ServiceDiscoveryError: If there's an error during service discovery.
@@ -45,6 +49,7 @@ class Services(QcloudBase):
         self._check(_d)
         self._d_vs = _d["api_versions"]
         self._d_e = _d["endpoint"]
+        self._d_re = _d.get("regional_endpoint")
         self._d_s = _d["service"]
 
         super().__init__(
@@ -52,6 +57,8 @@ class Services(QcloudBase):
                 "Module": self.name,
                 "Version": self.version,
                 "EndPoint": self.endpoint,
+                "EndPointTemplate": self.regional_endpoint,
+                "EndPointMode": endpoint_mode,
                 "Region": region,
                 "SecretId": secret_id,
                 "SecretKey": secret_key,
@@ -122,6 +129,11 @@ class Services(QcloudBase):
         """str: The endpoint URL of the service."""
         return self._d_e
 
+    @property
+    def regional_endpoint(self) -> str:
+        """str: The regional endpoint template of the service, e.g. "cvm.{region}.tencentcloudapi.com"."""
+        return self._d_re or regional_template(self._d_e)
+
     @property
     def name(self) -> str:
         """str: The name of the service."""
@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+
+from pyqcloud_sdk.base import QcloudBase
+from pyqcloud_sdk.breaker import CircuitBreaker, get_circuit_breaker
+from pyqcloud_sdk.exceptions import AuthenticationError, CircuitOpenError, ServerError
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker("cvm/ap-shanghai", failure_threshold=2, recovery_timeout=30)
+
+    def fail(self):
+        self.breaker.after_call(self.breaker.before_call(), False)
+
+    def open_circuit(self):
+        for _ in range(2):
+            self.fail()
+
+    def probe(self):
+        self.breaker.recovery_timeout = 0
+        generation = self.breaker.before_call()
+        self.breaker.recovery_timeout = 30
+        return generation
+
+    def test_opens_after_threshold(self):
+        self.fail()
+        self.assertEqual(self.breaker.state, "closed")
+        self.fail()
+        self.assertEqual(self.breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+    def test_success_resets_failures(self):
+        self.fail()
+        self.breaker.after_call(self.breaker.before_call(), True)
+        self.fail()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_single_probe(self):
+        self.open_circuit()
+        generation = self.probe()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+        self.breaker.after_call(generation, True)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_probe_failure_reopens(self):
+        self.open_circuit()
+        self.breaker.after_call(self.probe(), False)
+        self.assertEqual(self.breaker.state, "open")
+
+    def test_stale_success_does_not_close(self):
+        stale = self.breaker.before_call()
+        self.open_circuit()
+        self.breaker.after_call(stale, True)
+        self.assertEqual(self.breaker.state, "open")
+
+    def test_stale_failure_ignored_while_half_open(self):
+        stale = self.breaker.before_call()
+        self.open_circuit()
+        generation = self.probe()
+        self.breaker.after_call(stale, False)
+        self.assertEqual(self.breaker.state, "half_open")
+        self.breaker.after_call(generation, True)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_shared_per_module_and_region(self):
+        breaker = get_circuit_breaker("test-breaker", "ap-shanghai")
+        self.assertIs(get_circuit_breaker("test-breaker", "ap-shanghai"), breaker)
+        self.assertIsNot(get_circuit_breaker("test-breaker", "ap-guangzhou"), breaker)
+
+
+class TestQcloudBaseCircuitBreaker(unittest.TestCase):
+    def test_fail_fast(self):
+        client = MagicMock()
+        client.call_json.side_effect = TencentCloudSDKException("ClientNetworkError", "timeout")
+        base = QcloudBase({"Module": "test-fail-fast", "Version": "2017-03-12", "Region": "ap-shanghai"}, client)
+        base.enable_circuit_breaker(failure_threshold=2)
+
+        for _ in range(2):
+            with self.assertRaises(ServerError):
+                base.call("DescribeInstances", {})
+        with self.assertRaises(CircuitOpenError):
+            base.call("DescribeInstances", {})
+        self.assertEqual(client.call_json.call_count, 2)
+
+    def test_client_errors_do_not_open(self):
+        client = MagicMock()
+        client.call_json.side_effect = TencentCloudSDKException("InvalidParameter", "bad", "1")
+        base = QcloudBase({"Module": "test-client-errors", "Version": "2017-03-12", "Region": "ap-shanghai"}, client)
+        base.enable_circuit_breaker(failure_threshold=1)
+
+        for _ in range(3):
+            with self.assertRaises(ServerError):
+                base.call("DescribeInstances", {})
+        self.assertEqual(base._get_circuit_breaker().state, "closed")
+
+    def test_unrelated_errors_not_reported(self):
+        base = QcloudBase({"Module": "test-unrelated", "Version": "2017-03-12", "Region": "ap-shanghai"})
+        base.enable_circuit_breaker(failure_threshold=1, recovery_timeout=0)
+        breaker = base._get_circuit_breaker()
+        breaker.after_call(breaker.before_call(), False)
+
+        with patch.object(base, "_get_client", side_effect=AuthenticationError("no secret")):
+            with self.assertRaises(AuthenticationError):
+                base.call("DescribeInstances", {})
+        self.assertEqual(breaker.state, "half_open")
+
+    def test_settings_apply_to_shared_breaker(self):
+        config = {"Module": "test-settings", "Version": "2017-03-12", "Region": "ap-shanghai"}
+        first, second = QcloudBase(config), QcloudBase(config)
+        first.enable_circuit_breaker(failure_threshold=5)
+        second.enable_circuit_breaker(failure_threshold=2, recovery_timeout=10)
+
+        breaker = first._get_circuit_breaker()
+        self.assertIs(breaker, second._get_circuit_breaker())
+        self.assertEqual((breaker.failure_threshold, breaker.recovery_timeout), (2, 10))
+
+    def test_call_with_retry_fails_fast(self):
+        base = QcloudBase({"Module": "test-retry", "Version": "2017-03-12", "Region": "ap-shanghai"}, MagicMock())
+        base.enable_circuit_breaker()
+        with patch.object(base, "_send", side_effect=CircuitOpenError("open")):
+            with self.assertRaises(CircuitOpenError):
+                base.call_with_retry("DescribeInstances", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,8 @@ class TestConfig(unittest.TestCase):
         self.assertIsNone(self.config.Module)
         self.assertIsNone(self.config.Version)
         self.assertIsNone(self.config.EndPoint)
+        self.assertIsNone(self.config.EndPointTemplate)
+        self.assertIsNone(self.config.EndPointMode)
         self.assertIsNone(self.config.Region)
         self.assertIsNone(self.config.SecretId)
         self.assertIsNone(self.config.SecretKey)
@@ -24,6 +26,8 @@ class TestConfig(unittest.TestCase):
             "Module": "TestModule",
             "Version": "1.0",
             "EndPoint": "test.endpoint.com",
+            "EndPointTemplate": "test.{region}.endpoint.com",
+            "EndPointMode": "regional",
             "Region": "test-region",
             "SecretId": "test-secret-id",
             "SecretKey": "test-secret-key",
@@ -33,6 +37,8 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(self.config.Module, "TestModule")
         self.assertEqual(self.config.Version, "1.0")
         self.assertEqual(self.config.EndPoint, "test.endpoint.com")
+        self.assertEqual(self.config.EndPointTemplate, "test.{region}.endpoint.com")
+        self.assertEqual(self.config.EndPointMode, "regional")
         self.assertEqual(self.config.Region, "test-region")
         self.assertEqual(self.config.SecretId, "test-secret-id")
         self.assertEqual(self.config.SecretKey, "test-secret-key")
@@ -48,6 +54,8 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(self.config.Module, "TestModule")
         self.assertEqual(self.config.Version, "1.0")
         self.assertIsNone(self.config.EndPoint)
+        self.assertIsNone(self.config.EndPointTemplate)
+        self.assertIsNone(self.config.EndPointMode)
         self.assertIsNone(self.config.Region)
         self.assertIsNone(self.config.SecretId)
         self.assertIsNone(self.config.SecretKey)
@@ -69,6 +77,8 @@ class TestConfig(unittest.TestCase):
         self.assertIsNone(self.config.Module)
         self.assertIsNone(self.config.Version)
         self.assertIsNone(self.config.EndPoint)
+        self.assertIsNone(self.config.EndPointTemplate)
+        self.assertIsNone(self.config.EndPointMode)
         self.assertIsNone(self.config.Region)
         self.assertIsNone(self.config.SecretId)
         self.assertIsNone(self.config.SecretKey)
@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+
+from pyqcloud_sdk.base import QcloudBase
+from pyqcloud_sdk.endpoint import EndpointSelector, regional_endpoint, regional_template
+from pyqcloud_sdk.exceptions import ConfigError, ServerError
+
+
+class TestRegionalEndpoint(unittest.TestCase):
+    def test_regional_template(self):
+        self.assertEqual(regional_template("cvm.tencentcloudapi.com"), "cvm.{region}.tencentcloudapi.com")
+
+    def test_regional_endpoint(self):
+        endpoint = regional_endpoint("cvm.{region}.tencentcloudapi.com", "ap-shanghai")
+        self.assertEqual(endpoint, "cvm.ap-shanghai.tencentcloudapi.com")
+
+    def test_regional_endpoint_without_region(self):
+        with self.assertRaises(ConfigError):
+            regional_endpoint("cvm.{region}.tencentcloudapi.com", None)
+
+    def test_regional_endpoint_invalid_template(self):
+        with self.assertRaises(ConfigError):
+            regional_endpoint("cvm.{zone}.tencentcloudapi.com", "ap-shanghai")
+
+
+class TestEndpointSelector(unittest.TestCase):
+    def setUp(self):
+        self.selector = EndpointSelector(["regional", "global"], alpha=0.5)
+
+    def test_unmeasured_endpoints_first(self):
+        self.assertEqual(self.selector.select(), "regional")
+        self.selector.record_success("regional", 0.1)
+        self.assertEqual(self.selector.select(), "global")
+
+    def test_select_lowest_score(self):
+        self.selector.record_success("regional", 0.01)
+        self.selector.record_success("global", 0.05)
+        self.assertEqual(self.selector.select(), "regional")
+
+    def test_moving_average(self):
+        self.selector.record_success("regional", 0.1)
+        self.selector.record_success("regional", 0.3)
+        self.assertAlmostEqual(self.selector.score("regional"), 0.2)
+
+    def test_failure_cooldown(self):
+        self.selector.record_success("regional", 0.01)
+        self.selector.record_success("global", 0.05)
+        self.selector.record_failure("regional")
+        self.assertEqual(self.selector.select(), "global")
+        self.assertEqual(self.selector.score("regional"), 0.01)
+
+    def test_recovery_after_one_failure(self):
+        with patch("pyqcloud_sdk.endpoint.monotonic", return_value=100.0) as mock_monotonic:
+            self.selector.record_success("regional", 0.01)
+            self.selector.record_success("global", 0.05)
+            self.selector.record_failure("regional")
+            self.assertEqual(self.selector.select(), "global")
+
+            mock_monotonic.return_value = 101.0
+            self.assertEqual(self.selector.select(), "regional")
+            self.selector.record_success("regional", 0.012)
+            self.assertEqual(self.selector.score("regional"), 0.012)
+            self.assertEqual(self.selector.select(), "regional")
+
+    def test_cooldown_backoff(self):
+        with patch("pyqcloud_sdk.endpoint.monotonic", return_value=100.0) as mock_monotonic:
+            self.selector.record_success("global", 0.05)
+            self.selector.record_failure("regional")
+            self.selector.record_failure("regional")
+            mock_monotonic.return_value = 101.0
+            self.assertEqual(self.selector.select(), "global")
+            mock_monotonic.return_value = 102.0
+            self.assertEqual(self.selector.select(), "regional")
+
+    def test_all_endpoints_cooling_down(self):
+        self.selector.record_failure("global")
+        self.selector.record_failure("regional")
+        self.assertEqual(self.selector.select(), "global")
+
+    def test_probe_idle_endpoint(self):
+        selector = EndpointSelector(["regional", "global"], probe_interval=0)
+        selector.record_success("regional", 0.01)
+        selector.record_success("global", 0.05)
+        self.assertEqual(selector.select(), "regional")
+
+    def test_empty_endpoints(self):
+        with self.assertRaises(ConfigError):
+            EndpointSelector([])
+
+
+class TestEndpointRouting(unittest.TestCase):
+    def make_base(self, mode):
+        return QcloudBase(
+            {
+                "Module": "cvm",
+                "Version": "2017-03-12",
+                "EndPoint": "cvm.tencentcloudapi.com",
+                "EndPointTemplate": "cvm.{region}.tencentcloudapi.com",
+                "EndPointMode": mode,
+                "Region": "ap-shanghai",
+                "SecretId": "id",
+                "SecretKey": "key",
+            }
+        )
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ConfigError):
+            self.make_base("nearest")
+
+    def test_global_mode(self):
+        self.assertEqual(self.make_base(None)._resolve_endpoint(), "cvm.tencentcloudapi.com")
+
+    def test_regional_mode(self):
+        base = self.make_base("regional")
+        self.assertEqual(base._resolve_endpoint(), "cvm.ap-shanghai.tencentcloudapi.com")
+        base.set_region("ap-guangzhou")
+        self.assertEqual(base._resolve_endpoint(), "cvm.ap-guangzhou.tencentcloudapi.com")
+
+    def test_latency_mode_failover(self):
+        base = self.make_base("latency")
+        regional, fallback = MagicMock(), MagicMock()
+        regional.call_json.side_effect = TencentCloudSDKException("ClientNetworkError", "timeout")
+        fallback.call_json.return_value = {"Response": {"RequestId": "1"}}
+        clients = {"cvm.ap-shanghai.tencentcloudapi.com": regional, "cvm.tencentcloudapi.com": fallback}
+
+        with patch.object(base, "_get_client", side_effect=clients.get):
+            self.assertEqual(base.call("DescribeInstances", {}), {"Response": {"RequestId": "1"}})
+
+        self.assertEqual(base._resolve_endpoint(), "cvm.tencentcloudapi.com")
+        self.assertIsNotNone(base._endpoint_selector.score("cvm.tencentcloudapi.com"))
+
+    def test_latency_mode_failover_failure_reported(self):
+        base = self.make_base("latency")
+        client = MagicMock()
+        client.call_json.side_effect = TencentCloudSDKException("ClientNetworkError", "timeout")
+
+        with patch.object(base, "_get_client", return_value=client):
+            with self.assertRaises(ServerError):
+                base.call("DescribeInstances", {})
+
+        self.assertEqual(client.call_json.call_count, 2)
+        self.assertEqual(base._endpoint_selector._failures, {e: 1 for e in base._endpoint_selector.endpoints})
+
+    def test_regional_mode_without_region(self):
+        base = self.make_base("regional")
+        base.config.Region = None
+        with self.assertRaises(ConfigError) as ctx:
+            base.call("DescribeInstances", {})
+        self.assertIn("Region is required", str(ctx.exception))
+
+    def test_latency_mode_api_error_no_failover(self):
+        base = self.make_base("latency")
+        client = MagicMock()
+        client.call_json.side_effect = TencentCloudSDKException("InvalidParameter", "bad", "1")
+
+        with patch.object(base, "_get_client", return_value=client):
+            with self.assertRaises(ServerError):
+                base.call("DescribeInstances", {})
+
+        self.assertEqual(client.call_json.call_count, 1)
+        self.assertLess(base._endpoint_selector.score("cvm.ap-shanghai.tencentcloudapi.com"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
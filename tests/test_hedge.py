@@ -0,0 +1,150 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from pyqcloud_sdk.base import QcloudBase
+from pyqcloud_sdk.hedge import HedgePolicy
+
+
+class TestHedgePolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = HedgePolicy(quantile=0.95, min_samples=3)
+
+    def test_is_hedged(self):
+        self.assertTrue(self.policy.is_hedged("DescribeInstances"))
+        self.assertFalse(self.policy.is_hedged("RunInstances"))
+
+    def test_delay_requires_samples(self):
+        self.assertIsNone(self.policy.delay())
+        for elapsed in (0.3, 0.1, 0.2):
+            self.policy.record(elapsed)
+        self.assertEqual(self.policy.delay(), 0.3)
+
+    def test_no_hedge_without_samples(self):
+        func = MagicMock(return_value="ok")
+        self.assertEqual(self.policy.run(func), "ok")
+        func.assert_called_once_with()
+
+    def prime(self, policy, latency):
+        for _ in range(policy.min_samples):
+            policy.record(latency)
+
+    def test_fast_hedge_wins(self):
+        self.policy.budget = 1
+        self.prime(self.policy, 0.01)
+
+        def func():
+            if threading.current_thread().name.startswith("pyqcloud-hedge"):
+                return "fast"
+            time.sleep(0.5)
+            return "slow"
+
+        start = time.monotonic()
+        self.assertEqual(self.policy.run(func), "fast")
+        self.assertLess(time.monotonic() - start, 0.3)
+
+    def test_hedge_timers_do_not_hold_workers(self):
+        policy = HedgePolicy(min_samples=3, max_workers=1, budget=1)
+        self.prime(policy, 0.01)
+        results = []
+
+        def func():
+            if threading.current_thread().name.startswith("pyqcloud-hedge"):
+                return "fast"
+            time.sleep(0.5)
+            return "slow"
+
+        threads = [threading.Thread(target=lambda: results.append(policy.run(func))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["fast"] * 4)
+
+    def test_concurrent_calls_not_capped_by_pool(self):
+        policy = HedgePolicy(min_samples=3, max_workers=2)
+        self.prime(policy, 10)
+        threads = [threading.Thread(target=policy.run, args=(lambda: time.sleep(0.1),)) for _ in range(16)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time.monotonic() - start, 0.3)
+
+    def test_slow_attempt_sends_hedge(self):
+        self.policy.budget = 1
+        self.prime(self.policy, 0.01)
+        func = MagicMock(side_effect=lambda: time.sleep(0.1) or "ok")
+        self.assertEqual(self.policy.run(func), "ok")
+        self.assertEqual(func.call_count, 2)
+
+    def test_pending_hedge_cancelled(self):
+        self.policy.budget = 1
+        self.prime(self.policy, 10)
+        func = MagicMock(return_value="ok")
+        self.assertEqual(self.policy.run(func), "ok")
+        time.sleep(0.05)
+        self.assertEqual(func.call_count, 1)
+
+    def test_failed_attempt_uses_hedge(self):
+        self.policy.budget = 1
+        self.prime(self.policy, 0.01)
+
+        def func():
+            if threading.current_thread().name.startswith("pyqcloud-hedge"):
+                time.sleep(0.1)
+                return "hedged"
+            time.sleep(0.05)
+            raise ValueError("attempt failed")
+
+        self.assertEqual(self.policy.run(func), "hedged")
+
+    def test_budget_exhausted(self):
+        self.policy.budget = 0
+        self.prime(self.policy, 0.01)
+        func = MagicMock(side_effect=lambda: time.sleep(0.05) or "ok")
+        self.assertEqual(self.policy.run(func), "ok")
+        self.assertEqual(func.call_count, 1)
+
+    def test_all_attempts_fail(self):
+        self.policy.budget = 1
+        self.prime(self.policy, 0.0)
+
+        def func():
+            time.sleep(0.01)
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            self.policy.run(func)
+
+
+class TestQcloudBaseHedging(unittest.TestCase):
+    def test_enable_twice_shuts_down_previous_pool(self):
+        base = QcloudBase({"Module": "cvm", "Version": "2017-03-12", "Region": "ap-shanghai"}, MagicMock())
+        base.enable_hedging()
+        previous = base._hedge_policy
+        base.enable_hedging(quantile=0.9)
+        with self.assertRaises(RuntimeError):
+            previous._executor.submit(print)
+
+    def test_shut_down_policy_runs_without_hedge(self):
+        policy = HedgePolicy(min_samples=1, budget=1)
+        policy.record(0.01)
+        policy.shutdown()
+        self.assertEqual(policy.run(lambda: time.sleep(0.05) or "ok"), "ok")
+
+    def test_write_actions_not_hedged(self):
+        client = MagicMock()
+        client.call_json.return_value = {"Response": {"RequestId": "1"}}
+        base = QcloudBase({"Module": "cvm", "Version": "2017-03-12", "Region": "ap-shanghai"}, client)
+        base.enable_hedging(min_samples=1)
+
+        base.call("DescribeInstances", {})
+        base.call("RunInstances", {})
+        self.assertEqual(len(base._hedge_policy._latencies), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
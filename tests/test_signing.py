@@ -0,0 +1,98 @@
+import hashlib
+import hmac
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tencentcloud.common.common_client import CommonClient
+from tencentcloud.common.credential import Credential
+from tencentcloud.common.http.request import RequestInternal
+from tencentcloud.common.sign import Sign
+
+from pyqcloud_sdk.base import QcloudBase
+from pyqcloud_sdk.exceptions import ServerError
+from pyqcloud_sdk import signing
+from pyqcloud_sdk.signing import Payload, SigningClient, signing_key
+
+PARAMS = {"Limit": 1, "Filters": [{"Name": "zone", "Values": ["ap-shanghai-2"]}], "Name": "测试"}
+
+
+class TestSigning(unittest.TestCase):
+    def build_request(self, client_class, params, method="POST", unsigned=False, sign_method=None):
+        client = client_class("cvm", "2017-03-12", Credential("id", "key"), "ap-shanghai")
+        client.profile.httpProfile.reqMethod = method
+        client.profile.unsignedPayload = unsigned
+        if sign_method:
+            client.profile.signMethod = sign_method
+        req = RequestInternal("cvm.tencentcloudapi.com", method, "/")
+        with patch("time.time", return_value=1700000000), patch("random.randint", return_value=1):
+            client._build_req_inter("DescribeInstances", params, req)
+        return req
+
+    def test_signing_key_cached(self):
+        key = signing_key("key", "2024-01-01", "cvm")
+        self.assertIs(signing_key("key", "2024-01-01", "cvm"), key)
+
+    def test_signing_key_cache_has_no_secret(self):
+        signing_key("raw-secret", "2024-01-01", "cvm")
+        self.assertNotIn("raw-secret", str(list(signing._signing_keys)))
+
+    def test_signing_key_matches_sdk(self):
+        key = signing_key("key", "2024-01-01", "cvm")
+        expected = Sign.sign_tc3("key", "2024-01-01", "cvm", "message")
+        self.assertEqual(hmac.new(key, b"message", hashlib.sha256).hexdigest(), expected)
+
+    def test_same_request_as_sdk(self):
+        expected = self.build_request(CommonClient, PARAMS)
+        for params in (PARAMS, Payload(PARAMS)):
+            req = self.build_request(SigningClient, params)
+            self.assertEqual(req.data, expected.data)
+            self.assertEqual(req.header, expected.header)
+
+    def test_unsigned_payload_same_as_sdk(self):
+        expected = self.build_request(CommonClient, PARAMS, unsigned=True)
+        req = self.build_request(SigningClient, Payload(PARAMS), unsigned=True)
+        self.assertEqual(req.data, expected.data)
+        self.assertEqual(req.header, expected.header)
+
+    def test_old_signature_falls_back_to_sdk(self):
+        expected = self.build_request(CommonClient, {"Limit": 1}, sign_method="HmacSHA256")
+        req = self.build_request(SigningClient, Payload({"Limit": 1}), sign_method="HmacSHA256")
+        self.assertEqual(req.data, expected.data)
+        self.assertEqual(req.header, expected.header)
+
+    def test_get_request_falls_back_to_sdk(self):
+        expected = self.build_request(CommonClient, {"Limit": 1}, method="GET")
+        req = self.build_request(SigningClient, Payload({"Limit": 1}), method="GET")
+        self.assertEqual(req.data, expected.data)
+        self.assertEqual(req.header, expected.header)
+
+    def test_payload_snapshot(self):
+        params = {"Limit": 1}
+        payload = Payload(params)
+        params["Limit"] = 2
+        self.assertEqual(payload.data, '{"Limit": 1}')
+        self.assertEqual(repr(payload), "{'Limit': 1}")
+
+
+class TestQcloudBasePayload(unittest.TestCase):
+    def test_injected_client_gets_params(self):
+        client = MagicMock(spec=CommonClient)
+        client.call_json.return_value = {"Response": {"RequestId": "1"}}
+        base = QcloudBase({"Module": "cvm", "Version": "2017-03-12", "Region": "ap-shanghai"}, client)
+
+        base.call("DescribeInstances", Payload({"Limit": 1}))
+        client.call_json.assert_called_once_with("DescribeInstances", {"Limit": 1}, headers={})
+
+    def test_call_with_retry_serializes_once(self):
+        base = QcloudBase({"Module": "cvm", "Version": "2017-03-12", "Region": "ap-shanghai"}, MagicMock())
+        busy = ServerError("tasks are being processed")
+        with patch.object(base, "call", side_effect=[busy, busy, {}]) as mock_call, patch("pyqcloud_sdk.base.sleep"):
+            base.call_with_retry("DescribeInstances", {"Limit": 1})
+
+        first, second, third = (c.kwargs["action_params"] for c in mock_call.call_args_list)
+        self.assertEqual(first, {"Limit": 1})
+        self.assertIsInstance(second, Payload)
+        self.assertIs(third, second)
+
+if __name__ == "__main__":
+    unittest.main()